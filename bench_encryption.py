@@ -0,0 +1,95 @@
+import argparse
+import json
+import random
+import time
+
+from cryptography.fernet import Fernet
+
+from storage import MessageCipher, RecordCodec
+
+# Сравнение шифрования истории: прежний способ (вся история в JSON шифруется Fernet при каждой записи
+# и расшифровывается при каждом чтении), Fernet для каждого сообщения и MessageCipher (AES-GCM для
+# каждого сообщения, байты без base64), в том числе со сжатием записи перед шифрованием (RecordCodec).
+# Один ход - запись вопроса и ответа и чтение всей истории
+
+SAMPLE_TEXTS = [
+    "Привет! Подскажи, пожалуйста, как правильно составить план тренировок на неделю для начинающего?",
+    "Конечно! Вот примерный план: понедельник - силовая тренировка всего тела, вторник - кардио 30 минут, "
+    "среда - отдых или растяжка, четверг - силовая тренировка, пятница - интервальное кардио.",
+    "Дякую! А що робити, якщо після тренування болять м'язи? Чи можна тренуватися далі?",
+    "Легкий біль у м'язах після тренування - це нормально. Дайте м'язам 48 годин на відновлення, "
+    "пийте більше води та не забувайте про розтяжку.",
+    "Can you also recommend a simple high-protein breakfast that takes less than ten minutes?",
+    "Sure! Try Greek yogurt with berries and nuts, or scrambled eggs with spinach on whole-grain toast.",
+]
+
+
+def make_history(count, rng):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": rng.choice(SAMPLE_TEXTS)}
+            for i in range(count)]
+
+
+# Прежний способ: история целиком в одном зашифрованном JSON
+def bench_fernet_json(fernet, history, turns):
+    stored = fernet.encrypt(json.dumps(history).encode()).decode()
+    write = read = 0.0
+    for turn in range(turns):
+        started = time.perf_counter()
+        messages = json.loads(fernet.decrypt(stored.encode()).decode())
+        read += time.perf_counter() - started
+        messages.extend(history[turn % len(history):turn % len(history) + 2])
+        started = time.perf_counter()
+        stored = fernet.encrypt(json.dumps(messages).encode()).decode()
+        write += time.perf_counter() - started
+    return write, read, len(stored.encode())
+
+
+# Каждое сообщение отдельно: encrypt/decrypt - функции шифра, на ход шифруются только новые сообщения
+def bench_per_message(encrypt, decrypt, history, turns):
+    stored = [encrypt(msg["content"]) for msg in history]
+    write = read = 0.0
+    for turn in range(turns):
+        started = time.perf_counter()
+        decoded = [decrypt(content) for content in stored]
+        read += time.perf_counter() - started
+        assert len(decoded) == len(stored)
+        started = time.perf_counter()
+        stored.extend(encrypt(msg["content"]) for msg in history[turn % len(history):turn % len(history) + 2])
+        write += time.perf_counter() - started
+    return write, read, sum(len(content) for content in stored)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение шифрования истории сообщений")
+    parser.add_argument("--messages", type=int, default=50, help="сообщений в истории")
+    parser.add_argument("--turns", type=int, default=200, help="ходов диалога в замере")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    history = make_history(args.messages, random.Random(args.seed))
+    key = Fernet.generate_key()
+    fernet = Fernet(key)
+    cipher = MessageCipher.from_config(key.decode())
+    codec = RecordCodec("zlib")
+
+    results = {
+        "Fernet, вся история в JSON": bench_fernet_json(fernet, history, args.turns),
+        "Fernet, по сообщению": bench_per_message(lambda text: fernet.encrypt(text.encode()).decode(),
+                                                   lambda data: fernet.decrypt(data.encode()).decode(),
+                                                   history, args.turns),
+        "AES-GCM, по сообщению": bench_per_message(lambda text: cipher.encrypt(text.encode()),
+                                                    lambda data: cipher.decrypt(data).decode(),
+                                                    history, args.turns),
+        "AES-GCM + сжатие zlib": bench_per_message(lambda text: cipher.encrypt(codec.encode(text)),
+                                                    lambda data: codec.decode(cipher.decrypt(data)),
+                                                    history, args.turns),
+    }
+
+    print(f"История {args.messages} сообщений, {args.turns} ходов")
+    for name, (write, read, size) in results.items():
+        print(f"{name:28} запись {write / args.turns * 1e6:8.1f} мкс/ход, чтение {read / args.turns * 1e6:8.1f} мкс/ход, "
+              f"хранится {size} байт")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,26 @@
-import sqlite3
+import asyncio
+import os
+from dotenv import load_dotenv
+from storage import create_storage
+
+load_dotenv()
+
+# Хранилище то же, что у бота (STORAGE_URL или sqlite:///DB_NAME)
+storage = create_storage(os.getenv('STORAGE_URL', f"sqlite:///{os.getenv('DB_NAME', 'users.db')}"))
 
 # Функция для обновления количества запросов
-def update_user_requests(user_id, new_requests):
-    conn = sqlite3.connect('users.db')
-    cursor = conn.cursor()
-    cursor.execute('UPDATE users SET requests = ? WHERE user_id = ?', (new_requests, user_id))
-    conn.commit()
-    conn.close()
+async def update_user_requests(user_id, new_requests):
+    await storage.run(storage.set_user_requests, user_id, new_requests)
 
 # Функция для обновления статуса оплаты
-def update_user_payment_status(user_id, paid_status):
-    conn = sqlite3.connect('users.db')
-    cursor = conn.cursor()
-    cursor.execute('UPDATE users SET paid = ? WHERE user_id = ?', (paid_status, user_id))
-    conn.commit()
-    conn.close()
+async def update_user_payment_status(user_id, paid_status):
+    await storage.run(storage.update_payment_status, user_id, paid_status)
 
 # Пример использования
-user_id = 12345  # Укажите user_id, для которого нужно изменить данные
-update_user_requests(user_id, 15)  # Увеличьте количество запросов до 15
-update_user_payment_status(user_id, True)  # Установите статус оплаты на True (проплачено)
+async def main():
+    user_id = 12345  # Укажите user_id, для которого нужно изменить данные
+    await update_user_requests(user_id, 15)  # Увеличьте количество запросов до 15
+    await update_user_payment_status(user_id, True)  # Установите статус оплаты на True (проплачено)
+    await storage.shutdown()
+
+asyncio.run(main())
@@ -0,0 +1,49 @@
+from cryptography.fernet import Fernet
+
+from storage import MessageCipher, Storage
+
+
+def make_storage(history_chunk=10):
+    storage = Storage(MessageCipher.from_config(Fernet.generate_key().decode()))
+    storage.history_chunk = history_chunk
+    return storage
+
+
+# Строки (seq, role, content, tokens) от новых к старым, как их отдает база: вопросы по 10 токенов, ответы по 100
+def make_rows(storage, count):
+    rows = []
+    for seq in range(count, 0, -1):
+        role = "user" if seq % 2 else "assistant"
+        rows.append((seq, role, storage.encrypt_data(f"{role} {seq}"), 10 if role == "user" else 100))
+    return rows
+
+
+def test_overflow_keeps_everything_that_fits_when_chunk_is_larger():
+    storage = make_storage()
+    # Помещаются 4 последних сообщения (220 токенов), выравнивание на 10 оставило бы одно
+    history = storage.pack_history(make_rows(storage, 40), 250)
+    assert [message["content"] for message in history] == ["user 37", "assistant 38", "user 39", "assistant 40"]
+
+
+def test_overflow_aligns_start_in_chunks():
+    storage = make_storage(history_chunk=4)
+    starts = set()
+    for count in range(20, 40, 2):
+        history = storage.pack_history(make_rows(storage, count), 1000)
+        assert len(history) >= storage.history_chunk
+        assert history[0]["role"] == "user"
+        starts.add(history[0]["content"])
+    # Начало истории меняется скачками, а не на каждом ходу
+    assert len(starts) < 10
+
+
+def test_overflow_does_not_start_with_assistant():
+    storage = make_storage(history_chunk=1)
+    history = storage.pack_history(make_rows(storage, 40), 215)
+    assert history[0] == {"role": "user", "content": "user 39"}
+
+
+def test_history_that_fits_is_not_trimmed():
+    storage = make_storage()
+    history = storage.pack_history(make_rows(storage, 6), 10000)
+    assert len(history) == 6
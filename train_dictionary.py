@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+from storage import MessageCipher, RecordCodec, create_storage, train_dictionary
+
+# Обучение словаря сжатия истории на последних сообщениях из хранилища бота.
+# Готовый файл подключается в боте: HISTORY_DICTIONARIES=1:путь (прежние словари оставить в списке,
+# чтобы читались старые сообщения). Сообщения, сжатые прежним словарем, пересжимаются при чтении
+
+load_dotenv()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Обучение словаря сжатия истории сообщений")
+    parser.add_argument("--output", default="history.dict")
+    parser.add_argument("--method", default=os.getenv('HISTORY_COMPRESSION', 'zlib'), choices=["zlib", "zstd"])
+    parser.add_argument("--size", type=int, default=16384, help="размер словаря в байтах (для zlib не больше 32768)")
+    parser.add_argument("--samples", type=int, default=20000, help="сколько последних сообщений взять")
+    args = parser.parse_args()
+
+    storage = create_storage(os.getenv('STORAGE_URL', f"sqlite:///{os.getenv('DB_NAME', 'users.db')}"),
+                             MessageCipher.from_config(os.getenv('ENCRYPTION_KEY'), os.getenv('MESSAGE_KEYS', '')),
+                             codec=RecordCodec.from_config(args.method, os.getenv('HISTORY_DICTIONARIES', '')))
+    samples = await storage.run(storage.sample_messages, args.samples)
+    await storage.shutdown()
+    if not samples:
+        print("В хранилище нет сообщений")
+        return
+
+    dictionary = train_dictionary(samples, min(args.size, 32768) if args.method == "zlib" else args.size, args.method)
+    with open(args.output, "wb") as f:
+        f.write(dictionary)
+
+    # Сравнение размера образцов без словаря, со встроенным и с новым словарем
+    raw = sum(len(sample.encode()) for sample in samples)
+    print(f"Словарь {len(dictionary)} байт записан в {args.output}, образцов: {len(samples)} ({raw} байт)")
+    for name, codec in (("без сжатия", RecordCodec("none")),
+                        ("встроенный словарь", RecordCodec(args.method, active_dictionary=0)),
+                        ("новый словарь", RecordCodec(args.method, {1: dictionary}, 1))):
+        size = sum(len(codec.encode(sample)) for sample in samples)
+        print(f"{name:20} {size} байт ({size / raw:.0%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
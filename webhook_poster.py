@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import aiohttp
+
+# Отправка поддельных обновлений Telegram на вебхук бота (BOT_MODE=webhook) для локальной проверки
+# приема: несколько пользователей пишут одновременно, сообщения каждого пронумерованы по порядку.
+# Бот будет пытаться ответить в несуществующие чаты, поэтому ошибки отправки в его логе ожидаемы
+
+
+# Обновление с текстовым сообщением пользователя
+def make_update(update_id, user_id, text):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": f"Test {user_id}"},
+            "text": text
+        }
+    }
+
+
+async def post_user_updates(session, args, user_id, counter, latencies, statuses):
+    headers = {"X-Telegram-Bot-Api-Secret-Token": args.secret} if args.secret else {}
+    for number in range(1, args.messages + 1):
+        update = make_update(next(counter), user_id, f"Сообщение {number} от пользователя {user_id}")
+        started = time.perf_counter()
+        async with session.post(args.url, data=json.dumps(update), headers=headers,
+                                timeout=aiohttp.ClientTimeout(total=30)) as response:
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+        latencies.append(time.perf_counter() - started)
+        if args.delay:
+            await asyncio.sleep(random.uniform(0, args.delay))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Отправка поддельных обновлений Telegram на вебхук бота")
+    parser.add_argument("--url", default="http://127.0.0.1:8080/webhook")
+    parser.add_argument("--secret", default="", help="значение WEBHOOK_SECRET бота")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=5, help="сообщений от каждого пользователя")
+    parser.add_argument("--delay", type=float, default=0.0, help="максимальная пауза между сообщениями (сек)")
+    parser.add_argument("--first-user", type=int, default=1000000)
+    args = parser.parse_args()
+
+    counter = iter(range(random.randint(1, 10 ** 6), 10 ** 9))
+    latencies = []
+    statuses = {}
+    started = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(post_user_updates(session, args, args.first_user + i, counter, latencies, statuses)
+                               for i in range(args.users)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"Отправлено {len(latencies)} обновлений за {elapsed:.2f} с ({len(latencies) / elapsed:.0f} в секунду)")
+    print(f"Ответы: {statuses}")
+    print(f"Время ответа: p50 {latencies[len(latencies) // 2] * 1000:.1f} мс, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())